@@ -55,4 +55,10 @@ PASS_FAIL_THRESHOLD = 2.2  # GPA < 2.2 is FAIL
 # VALIDATION CONSTRAINTS
 # ============================================================================
 MIN_GPA = 0.0
-MAX_GPA = 4.0
\ No newline at end of file
+MAX_GPA = 4.0
+
+# ============================================================================
+# VALIDATION PATTERNS (compiled once in validators.py)
+# ============================================================================
+VALID_EMAIL_RE = r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$"
+VALID_STUDENT_ID_RE = r"^[A-Za-z0-9-]{1,20}$"
\ No newline at end of file
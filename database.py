@@ -5,32 +5,243 @@ Pass/Fail calculated based on GPA < 2.2
 Detailed error messages for debugging
 """
 
+import atexit
+import csv
+import logging
 import sqlite3
+import threading
 from contextlib import contextmanager
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import config
+import validators
+
+# pandas is optional: when present, CSV import parses and validates the
+# whole file in vectorized C-level passes instead of per-row Python.
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# numpy/numba are optional accelerators for bulk status computation.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+log = logging.getLogger(__name__)
 
 DEFAULT_DB_PATH = config.DEFAULT_DB_PATH
 
+# Per-connection performance PRAGMAs. journal_mode=WAL is persistent and set
+# once in init_database; the rest reset on every connection, so they are
+# applied each time we connect. synchronous=NORMAL is safe under WAL; the
+# aggressive variant (synchronous=OFF, journal_mode=MEMORY) trades durability
+# for speed and is deliberately not used here.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-100000",      # ~100 MB page cache
+    "PRAGMA mmap_size=268435456",     # 256 MB memory-mapped reads
+)
+
+
+def _apply_connection_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply the per-connection tuning PRAGMAs."""
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
+# SQL for the hot paths lives in module constants so every call passes the
+# same string object and hits the per-connection prepared-statement cache
+# instead of re-parsing the SQL.
+#
+# On disk, department is normalized into a small departments lookup table
+# and status is a generated 0/1 INTEGER, which shrinks each row so more
+# rows fit per page. The SELECTs decode both back to text, so callers
+# still see (..., department_name, ..., 'PASS'/'FAIL') tuples.
+_SQL_INSERT_DEPT = "INSERT OR IGNORE INTO departments (name) VALUES (?)"
+
+# Duplicate student_ids are short-circuited by the engine (DO NOTHING)
+# instead of raising IntegrityError through the Python bridge; a missing
+# RETURNING row signals the duplicate. executemany cannot consume
+# RETURNING rows, so the bulk variant drops that clause and the caller
+# counts insertions via the connection's change counter.
+_SQL_INSERT = """
+    INSERT INTO student
+    (student_id, name, age, email, department_id, gpa, graduation_year)
+    VALUES (?, ?, ?, ?, (SELECT id FROM departments WHERE name = ?), ?, ?)
+    ON CONFLICT(student_id) DO NOTHING
+    RETURNING id
+"""
+
+_SQL_INSERT_IGNORE = """
+    INSERT INTO student
+    (student_id, name, age, email, department_id, gpa, graduation_year)
+    VALUES (?, ?, ?, ?, (SELECT id FROM departments WHERE name = ?), ?, ?)
+    ON CONFLICT(student_id) DO NOTHING
+"""
+
+_SQL_UPDATE = """
+    UPDATE student
+    SET student_id=?, name=?, age=?, email=?,
+        department_id=(SELECT id FROM departments WHERE name = ?),
+        gpa=?, graduation_year=?
+    WHERE id=?
+    RETURNING id, student_id, name, age, email,
+              (SELECT name FROM departments WHERE id = department_id),
+              gpa, graduation_year,
+              CASE status WHEN 1 THEN 'PASS' ELSE 'FAIL' END
+"""
+
+_SQL_DELETE = "DELETE FROM student WHERE id = ? RETURNING id"
+
+_SQL_VIEW_ALL = """
+    SELECT s.id, s.student_id, s.name, s.age, s.email,
+           COALESCE(d.name, ''), s.gpa, s.graduation_year,
+           CASE s.status WHEN 1 THEN 'PASS' ELSE 'FAIL' END
+    FROM student s LEFT JOIN departments d ON d.id = s.department_id
+    ORDER BY s.name
+"""
+
+_SQL_VIEW_PAGE = """
+    SELECT s.id, s.student_id, s.name, s.age, s.email,
+           COALESCE(d.name, ''), s.gpa, s.graduation_year,
+           CASE s.status WHEN 1 THEN 'PASS' ELSE 'FAIL' END
+    FROM student s LEFT JOIN departments d ON d.id = s.department_id
+    WHERE (s.name, s.id) > (?, ?)
+    ORDER BY s.name, s.id
+    LIMIT ?
+"""
+
+_SQL_SEARCH_ID = """
+    SELECT s.id, s.student_id, s.name, s.age, s.email,
+           COALESCE(d.name, ''), s.gpa, s.graduation_year,
+           CASE s.status WHEN 1 THEN 'PASS' ELSE 'FAIL' END
+    FROM student s LEFT JOIN departments d ON d.id = s.department_id
+    WHERE s.student_id = ?
+"""
+
+_SQL_STATS = """
+    SELECT COUNT(*),
+           COALESCE(SUM(status), 0),
+           COALESCE(SUM(1 - status), 0),
+           COALESCE(AVG(gpa), 0.0),
+           COALESCE(SUM(gpa), 0.0)
+    FROM student
+"""
+
+
+# Connections are cached per thread (sqlite3 connections must not be shared
+# across threads) and per database path, so rapid UI callbacks reuse a warm
+# connection, page cache, and statement cache instead of paying a fresh
+# sqlite3.connect() on every call.
+_conn_cache = threading.local()
+_all_connections = []
+_all_connections_lock = threading.Lock()
+
+
+def _get_cached_connection(db_path: str, read_only: bool = False) -> sqlite3.Connection:
+    """Return this thread's cached connection for db_path, creating it lazily."""
+    cache = getattr(_conn_cache, 'connections', None)
+    if cache is None:
+        cache = _conn_cache.connections = {}
+    key = (db_path, read_only)
+    conn = cache.get(key)
+    if conn is None:
+        if read_only:
+            # Autocommit read-only connection: no transaction bookkeeping
+            # and, under WAL, never blocks or is blocked by the writer.
+            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True,
+                                   isolation_level=None, cached_statements=256)
+        else:
+            conn = sqlite3.connect(db_path, cached_statements=256)
+        _apply_connection_pragmas(conn)
+        cache[key] = conn
+        with _all_connections_lock:
+            _all_connections.append(conn)
+    return conn
+
+
+def _close_all() -> None:
+    """Close every cached connection (registered to run at interpreter exit)."""
+    with _all_connections_lock:
+        for conn in _all_connections:
+            try:
+                # Cheap "analyze only if stats are stale" hook; keeps the
+                # planner's view of the indexes current across sessions.
+                conn.execute("PRAGMA optimize")
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _all_connections.clear()
+
+
+atexit.register(_close_all)
+
 
 @contextmanager
 def get_db_connection(db_path: str = DEFAULT_DB_PATH):
-    """Context manager for database connections."""
-    conn = None
+    """Context manager yielding this thread's persistent database connection.
+
+    The connection is kept open between calls and closed at interpreter
+    exit, so short queries skip the per-call connect cost.
+    """
     try:
-        conn = sqlite3.connect(db_path)
-        yield conn
+        conn = _get_cached_connection(db_path)
     except sqlite3.Error as e:
-        if conn:
-            conn.rollback()
         raise RuntimeError(f"Database Connection Error: Unable to connect to database '{db_path}'. Error details: {str(e)}")
-    finally:
-        if conn:
-            conn.close()
+    try:
+        yield conn
+    except Exception:
+        # The connection outlives this block, so abandon any half-done
+        # transaction before re-raising (no-op when not in a transaction).
+        conn.rollback()
+        raise
+
+
+@contextmanager
+def transaction(db_path: str = DEFAULT_DB_PATH):
+    """Group several writes into one BEGIN IMMEDIATE ... COMMIT.
+
+    Yields a cursor to pass as the cursor argument of update_record /
+    delete_record, so a batch of edits pays a single write-lock acquire
+    and fsync instead of one per call. Rolls back if the block raises.
+    """
+    with get_db_connection(db_path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        yield conn.cursor()
+        conn.commit()
+
+
+@contextmanager
+def get_ro_connection(db_path: str = DEFAULT_DB_PATH):
+    """Context manager yielding a persistent read-only connection.
+
+    Read paths use this so they never take write locks or pay transaction
+    bookkeeping. Falls back to the regular connection when the database
+    file does not exist yet (mode=ro cannot create it).
+    """
+    try:
+        conn = _get_cached_connection(db_path, read_only=True)
+    except sqlite3.Error:
+        with get_db_connection(db_path) as conn:
+            yield conn
+        return
+    yield conn
 
 
 def calculate_status(gpa: float) -> str:
-    """Calculate PASS or FAIL based on GPA threshold."""
+    """Calculate PASS or FAIL based on GPA threshold.
+
+    The database derives the stored status itself (generated column);
+    this helper remains for UI previews and callers that have not hit
+    the database yet.
+    """
     try:
         gpa_val = float(gpa)
         return "FAIL" if gpa_val < config.PASS_FAIL_THRESHOLD else "PASS"
@@ -38,26 +249,83 @@ def calculate_status(gpa: float) -> str:
         return "FAIL"
 
 
+if njit is not None:
+    @njit(cache=True)
+    def _fail_mask(gpas):
+        return (gpas < config.PASS_FAIL_THRESHOLD).astype(np.int8)
+elif np is not None:
+    def _fail_mask(gpas):
+        return (gpas < config.PASS_FAIL_THRESHOLD).astype(np.int8)
+else:
+    _fail_mask = None
+
+
+def calculate_status_bulk(gpas) -> List[str]:
+    """Calculate PASS/FAIL for a whole sequence of GPAs at once.
+
+    The database derives stored statuses itself, so this is for bulk
+    consumers working outside the database (e.g. previewing a CSV before
+    import). With numpy/numba available the comparison runs as one
+    native pass over the array; otherwise it falls back to the scalar
+    helper per element.
+    """
+    if _fail_mask is not None:
+        arr = np.asarray(gpas, dtype=np.float64)
+        mask = _fail_mask(arr)
+        return np.where(mask, 'FAIL', 'PASS').tolist()
+    return [calculate_status(gpa) for gpa in gpas]
+
+
 def init_database(db_path: str = DEFAULT_DB_PATH) -> None:
     """Initialize the student database and create table if not exists."""
     try:
         with get_db_connection(db_path) as conn:
             cursor = conn.cursor()
+            # Must run before the first DML below: sqlite3 opens its
+            # implicit transaction on the department INSERTs, and SQLite
+            # silently refuses to switch journal modes mid-transaction.
+            mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if mode != 'wal':
+                log.warning("Could not enable WAL journal mode (got '%s')", mode)
             cursor.execute("""
+                CREATE TABLE IF NOT EXISTS departments (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL UNIQUE
+                )
+            """)
+            cursor.executemany(_SQL_INSERT_DEPT, [(name,) for name in config.DEPARTMENTS])
+            # status is derived by the engine from gpa (0=FAIL, 1=PASS),
+            # so inserts and updates never pass it and it can never drift
+            # out of sync with the threshold. department is stored as a
+            # small integer key into departments.
+            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS student (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     student_id TEXT NOT NULL UNIQUE,
                     name TEXT NOT NULL,
                     age INTEGER,
                     email TEXT,
-                    department TEXT,
+                    department_id INTEGER REFERENCES departments(id),
                     gpa REAL,
                     graduation_year INTEGER,
-                    status TEXT
+                    status INTEGER GENERATED ALWAYS AS (
+                        CASE
+                            WHEN gpa IS NULL THEN 0
+                            WHEN gpa < {config.PASS_FAIL_THRESHOLD} THEN 0
+                            ELSE 1
+                        END
+                    ) VIRTUAL
                 )
             """)
+            # student_id already has an implicit index via UNIQUE; these
+            # cover the ORDER BY name listing, the status counts in
+            # get_statistics, and future department filters.
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_student_name ON student(name)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_student_status ON student(status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_student_dept ON student(department_id)")
+            cursor.execute("ANALYZE")
             conn.commit()
-            print("[INFO] Database initialized successfully")
+            log.info("Database initialized successfully")
     except sqlite3.Error as e:
         raise RuntimeError(f"Database Initialization Error: Failed to create database table. Error: {str(e)}")
 
@@ -78,65 +346,362 @@ def add_student_record(
         raise ValueError("❌ Student ID is Empty: You must provide a Student ID. Student ID cannot be blank or contain only spaces.")
     if not name or not name.strip():
         raise ValueError("❌ Name is Empty: You must provide a Student Name. Name field cannot be blank or contain only spaces.")
-    
-    status = calculate_status(gpa)
-    
+
     try:
         with get_db_connection(db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO student 
-                (student_id, name, age, email, department, gpa, graduation_year, status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (student_id, name, age, email, department, gpa, graduation_year, status))
+            if department:
+                cursor.execute(_SQL_INSERT_DEPT, (department,))
+            row = cursor.execute(_SQL_INSERT, (student_id, name, age, email, department, gpa, graduation_year)).fetchone()
+            if row is None:
+                raise ValueError(f"❌ Duplicate Student ID: Student ID '{student_id}' already exists in the database. Please use a unique Student ID.")
             conn.commit()
             return True
-    except sqlite3.IntegrityError:
-        raise ValueError(f"❌ Duplicate Student ID: Student ID '{student_id}' already exists in the database. Please use a unique Student ID.")
     except sqlite3.Error as e:
         raise RuntimeError(f"❌ Database Insert Error: Failed to add student record. Details: {str(e)}")
 
 
+# Multi-VALUES chunk size: 7 bound parameters per row, kept well under
+# SQLite's default 999-variable limit.
+_MULTI_VALUES_MAX_ROWS = 100
+# Above this row count the single-VDBE-program advantage of multi-VALUES
+# fades and plain executemany is used instead.
+_SMALL_BATCH_THRESHOLD = 500
+
+
+def _bulk_insert_values(cursor, rows: List[Tuple]) -> None:
+    """Insert a small batch as single multi-VALUES INSERT statements.
+
+    One INSERT ... VALUES (...),(...),... executes a single VDBE program
+    instead of one prepare-bind-step cycle per row, which is measurably
+    faster for micro-batches. Rows are chunked to respect the bound-
+    parameter limit.
+    """
+    row_sql = "(?, ?, ?, ?, (SELECT id FROM departments WHERE name = ?), ?, ?)"
+    for start in range(0, len(rows), _MULTI_VALUES_MAX_ROWS):
+        chunk = rows[start:start + _MULTI_VALUES_MAX_ROWS]
+        sql = (
+            "INSERT INTO student "
+            "(student_id, name, age, email, department_id, gpa, graduation_year) "
+            "VALUES " + ",".join([row_sql] * len(chunk))
+            + " ON CONFLICT(student_id) DO NOTHING"
+        )
+        cursor.execute(sql, [value for row in chunk for value in row])
+
+
+def add_student_records_bulk(records: List[Tuple], db_path: str = DEFAULT_DB_PATH) -> dict:
+    """Add many student records in a single transaction.
+
+    Each record is a (student_id, name, age, email, department, gpa,
+    graduation_year) tuple. All valid rows are inserted with one
+    executemany inside one BEGIN IMMEDIATE ... COMMIT, so the whole batch
+    pays a single fsync instead of one per row. Rows with a blank
+    student_id or name are filtered out up front, and duplicate Student
+    IDs are skipped by the engine, so a bad row cannot abort the
+    transaction mid-batch.
+
+    Returns a report dict: {'inserted': int, 'skipped': int, 'errors': [str]}.
+    """
+    if not records:
+        return {'inserted': 0, 'skipped': 0, 'errors': []}
+
+    prepared = []
+    errors = []
+    for row_num, record in enumerate(records, start=1):
+        student_id, name, age, email, department, gpa, graduation_year = record
+        if not student_id or not str(student_id).strip():
+            errors.append(f"Row {row_num}: Student ID is empty")
+            continue
+        if not name or not str(name).strip():
+            errors.append(f"Row {row_num}: Name is empty")
+            continue
+        prepared.append((student_id, name, age, email, department, gpa, graduation_year))
+
+    try:
+        with get_db_connection(db_path) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.cursor()
+            departments = {row[4] for row in prepared if row[4]}
+            cursor.executemany(_SQL_INSERT_DEPT, [(name,) for name in departments])
+            changes_before = conn.total_changes
+            if len(prepared) <= _SMALL_BATCH_THRESHOLD:
+                _bulk_insert_values(cursor, prepared)
+            else:
+                cursor.executemany(_SQL_INSERT_IGNORE, prepared)
+            inserted = conn.total_changes - changes_before
+            conn.commit()
+            # A sizeable import shifts the data distribution; refresh the
+            # planner stats once for the whole batch.
+            conn.execute("ANALYZE student")
+            duplicates = len(prepared) - inserted
+            if duplicates:
+                errors.append(f"{duplicates} row(s) skipped: Student ID already exists")
+            return {'inserted': inserted, 'skipped': len(records) - inserted, 'errors': errors}
+    except sqlite3.Error as e:
+        raise RuntimeError(f"❌ Database Bulk Insert Error: Failed to add student records. No rows were added. Details: {str(e)}")
+
+
+def import_csv(csv_path: str, db_path: str = DEFAULT_DB_PATH) -> dict:
+    """Import student records from a CSV file in one bulk transaction.
+
+    Expects the columns from config.CSV_COLUMNS. With pandas installed
+    the numeric coercion and row filtering happen as vectorized column
+    operations; otherwise a plain csv loop prepares the rows. Either way
+    the database write is a single add_student_records_bulk call.
+
+    Returns the report dict from add_student_records_bulk, with 'skipped'
+    including rows dropped during parsing.
+    """
+    if pd is not None:
+        rows, parse_errors = _prepare_csv_rows_pandas(csv_path)
+    else:
+        rows, parse_errors = _prepare_csv_rows_stdlib(csv_path)
+
+    report = add_student_records_bulk(rows, db_path)
+    report['skipped'] += len(parse_errors)
+    report['errors'] = parse_errors + report['errors']
+    return report
+
+
+def _prepare_csv_rows_pandas(csv_path: str) -> Tuple[List[Tuple], List[str]]:
+    """Parse and validate a CSV with vectorized pandas column operations."""
+    df = pd.read_csv(csv_path, dtype=str).fillna('')
+    missing = [col for col in config.CSV_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"❌ CSV Format Error: The CSV file is missing required columns: {', '.join(missing)}.")
+
+    age = pd.to_numeric(df['Age'], errors='coerce')
+    gpa = pd.to_numeric(df['GPA'], errors='coerce')
+    year = pd.to_numeric(df['GraduationYear'], errors='coerce')
+    email = df['Email'].str.strip()
+    valid = (
+        df['StudentID'].str.strip().str.match(config.VALID_STUDENT_ID_RE)
+        & (df['Name'].str.strip() != '')
+        & ((email == '') | email.str.match(config.VALID_EMAIL_RE))
+        & age.notna() & gpa.notna() & year.notna()
+    )
+
+    rows = list(zip(
+        df.loc[valid, 'StudentID'].str.strip().tolist(),
+        df.loc[valid, 'Name'].str.strip().tolist(),
+        age[valid].astype(int).tolist(),
+        df.loc[valid, 'Email'].str.strip().tolist(),
+        df.loc[valid, 'Department'].str.strip().tolist(),
+        gpa[valid].tolist(),
+        year[valid].astype(int).tolist(),
+    ))
+    errors = [f"Row {i + 1}: invalid or incomplete values" for i in df.index[~valid]]
+    return rows, errors
+
+
+def _parse_csv_row(row: dict, row_num: int) -> Tuple[Optional[Tuple], Optional[str]]:
+    """Validate one CSV row dict; returns (record, None) or (None, error)."""
+    student_id = (row.get('StudentID') or '').strip()
+    email = (row.get('Email') or '').strip()
+    if not validators.is_valid_row(student_id, email):
+        return None, f"Row {row_num}: invalid Student ID or Email format"
+    try:
+        return (
+            student_id,
+            row.get('Name', '').strip(),
+            int(row.get('Age', '')),
+            email,
+            row.get('Department', '').strip(),
+            float(row.get('GPA', '')),
+            int(row.get('GraduationYear', '')),
+        ), None
+    except (ValueError, KeyError, AttributeError):
+        return None, f"Row {row_num}: invalid or incomplete values"
+
+
+def _prepare_csv_rows_stdlib(csv_path: str) -> Tuple[List[Tuple], List[str]]:
+    """Parse and validate a CSV with the stdlib csv module (pandas fallback)."""
+    rows = []
+    errors = []
+    with open(csv_path, 'r', encoding='utf-8', newline='') as csv_file:
+        reader = csv.DictReader(csv_file)
+        for row_num, row in enumerate(reader, start=1):
+            record, error = _parse_csv_row(row, row_num)
+            if record is not None:
+                rows.append(record)
+            else:
+                errors.append(error)
+    return rows, errors
+
+
+def iter_all_records(db_path: str = DEFAULT_DB_PATH, batch: int = 500):
+    """Yield all student records ordered by name, fetching in batches.
+
+    Rows are materialized batch-at-a-time instead of all at once, so
+    consumers that only need the first screenful never pay for the whole
+    table.
+    """
+    try:
+        with get_ro_connection(db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(_SQL_VIEW_ALL)
+            while True:
+                rows = cursor.fetchmany(batch)
+                if not rows:
+                    break
+                yield from rows
+    except sqlite3.Error as e:
+        raise RuntimeError(f"❌ Database Read Error: Failed to retrieve student records from database. Details: {str(e)}")
+
+
+def import_csv_parallel(
+    csv_path: str,
+    db_path: str = DEFAULT_DB_PATH,
+    workers: int = 4,
+    chunk_rows: int = 2000,
+    commit_every: int = 10000
+) -> dict:
+    """Import a large CSV, overlapping row validation with database writes.
+
+    Worker threads validate chunks of parsed rows while the calling
+    thread owns the single writer connection and drains finished chunks
+    into executemany, committing every commit_every rows. SQLite still
+    has exactly one writer; the win is that Python-side validation runs
+    while the writer waits on disk. A bounded queue of in-flight chunks
+    provides backpressure. Returns the same report dict as import_csv.
+    """
+    import concurrent.futures
+
+    def validate_chunk(chunk: List[Tuple[int, dict]]) -> Tuple[List[Tuple], List[str]]:
+        rows, errors = [], []
+        for row_num, row in chunk:
+            record, error = _parse_csv_row(row, row_num)
+            if record is not None:
+                rows.append(record)
+            else:
+                errors.append(error)
+        return rows, errors
+
+    inserted = 0
+    skipped = 0
+    errors: List[str] = []
+    max_in_flight = workers * 2
+
+    try:
+        with open(csv_path, 'r', encoding='utf-8', newline='') as csv_file, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool, \
+                get_db_connection(db_path) as conn:
+            cursor = conn.cursor()
+            conn.execute("BEGIN IMMEDIATE")
+            uncommitted = 0
+
+            def drain(future) -> None:
+                nonlocal inserted, skipped, uncommitted
+                rows, chunk_errors = future.result()
+                errors.extend(chunk_errors)
+                skipped += len(chunk_errors)
+                if rows:
+                    cursor.executemany(_SQL_INSERT_DEPT,
+                                       [(name,) for name in {r[4] for r in rows if r[4]}])
+                    changes_before = conn.total_changes
+                    cursor.executemany(_SQL_INSERT_IGNORE, rows)
+                    chunk_inserted = conn.total_changes - changes_before
+                    inserted += chunk_inserted
+                    skipped += len(rows) - chunk_inserted
+                    uncommitted += chunk_inserted
+                if uncommitted >= commit_every:
+                    conn.commit()
+                    conn.execute("BEGIN IMMEDIATE")
+                    uncommitted = 0
+
+            reader = csv.DictReader(csv_file)
+            in_flight = []
+            chunk: List[Tuple[int, dict]] = []
+            for row_num, row in enumerate(reader, start=1):
+                chunk.append((row_num, row))
+                if len(chunk) >= chunk_rows:
+                    in_flight.append(pool.submit(validate_chunk, chunk))
+                    chunk = []
+                    if len(in_flight) >= max_in_flight:
+                        drain(in_flight.pop(0))
+            if chunk:
+                in_flight.append(pool.submit(validate_chunk, chunk))
+            for future in in_flight:
+                drain(future)
+
+            conn.commit()
+            conn.execute("ANALYZE student")
+    except sqlite3.Error as e:
+        raise RuntimeError(f"❌ Database Bulk Insert Error: Failed to import CSV. Details: {str(e)}")
+
+    if skipped - len(errors) > 0:
+        errors.append(f"{skipped - len(errors)} row(s) skipped: Student ID already exists")
+    return {'inserted': inserted, 'skipped': skipped, 'errors': errors}
+
+
 def view_all_records(db_path: str = DEFAULT_DB_PATH) -> List[Tuple]:
     """Retrieve all student records from the database."""
+    return list(iter_all_records(db_path))
+
+
+def view_records_page(after_name: str = "", after_id: int = 0, limit: int = 500,
+                      db_path: str = DEFAULT_DB_PATH) -> List[Tuple]:
+    """Retrieve one page of records ordered by (name, id), starting after the cursor.
+
+    Keyset pagination: the WHERE (name, id) > (?, ?) predicate walks the
+    name index directly, unlike OFFSET which scans and discards all
+    preceding rows. The id tiebreak keeps the key unique, so rows sharing
+    a name with the previous page's last row are not skipped. Pass the
+    last row's name and database id to get the next page.
+    """
     try:
-        with get_db_connection(db_path) as conn:
+        with get_ro_connection(db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, student_id, name, age, email, department, gpa, 
-                       graduation_year, status
-                FROM student 
-                ORDER BY name
-            """)
+            cursor.execute(_SQL_VIEW_PAGE, (after_name, after_id, limit))
             return cursor.fetchall()
     except sqlite3.Error as e:
         raise RuntimeError(f"❌ Database Read Error: Failed to retrieve student records from database. Details: {str(e)}")
 
 
-def search_by_student_id(student_id: str, db_path: str = DEFAULT_DB_PATH) -> Tuple:
-    """Search for student by Student ID (exact match)."""
+def list_id_pairs(db_path: str = DEFAULT_DB_PATH) -> List[Tuple]:
+    """Retrieve (id, student_id) pairs for every student.
+
+    Callers that only need to map Student IDs to database ids should use
+    this instead of view_all_records: fetching two narrow columns skips
+    the departments join and the status decode entirely.
+    """
+    try:
+        with get_ro_connection(db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id, student_id FROM student")
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        raise RuntimeError(f"❌ Database Read Error: Failed to retrieve student ids from database. Details: {str(e)}")
+
+
+def search_by_student_id(student_id: str, db_path: str = DEFAULT_DB_PATH) -> Optional[Tuple]:
+    """Search for student by Student ID (exact match).
+
+    Returns the record tuple, or None when no student has that ID. A miss
+    is an ordinary outcome for existence probes (e.g. during import), so
+    it does not raise; use search_by_student_id_or_raise when a missing
+    student is an error.
+    """
     if not student_id or not student_id.strip():
         raise ValueError("❌ Empty Search: You must enter a Student ID to search. Search field cannot be blank.")
-    
+
     try:
-        with get_db_connection(db_path) as conn:
+        with get_ro_connection(db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, student_id, name, age, email, department, gpa, 
-                       graduation_year, status
-                FROM student 
-                WHERE student_id = ?
-            """, (student_id,))
-            result = cursor.fetchone()
-            if not result:
-                raise ValueError(f"❌ Student Not Found: No student record found with ID '{student_id}'. Please verify the Student ID and try again.")
-            return result
-    except ValueError:
-        raise
+            cursor.execute(_SQL_SEARCH_ID, (student_id,))
+            return cursor.fetchone()
     except sqlite3.Error as e:
         raise RuntimeError(f"❌ Database Search Error: Failed to search for student. Details: {str(e)}")
 
 
+def search_by_student_id_or_raise(student_id: str, db_path: str = DEFAULT_DB_PATH) -> Tuple:
+    """Search for student by Student ID, raising ValueError when absent."""
+    result = search_by_student_id(student_id, db_path)
+    if result is None:
+        raise ValueError(f"❌ Student Not Found: No student record found with ID '{student_id}'. Please verify the Student ID and try again.")
+    return result
+
+
 def update_record(
     record_id: int,
     student_id: str,
@@ -146,50 +711,72 @@ def update_record(
     department: str,
     gpa: float,
     graduation_year: int,
-    db_path: str = DEFAULT_DB_PATH
-) -> bool:
-    """Update an existing student record."""
-    
+    db_path: str = DEFAULT_DB_PATH,
+    cursor: Optional[sqlite3.Cursor] = None
+) -> Tuple:
+    """Update an existing student record.
+
+    Returns the updated row (including the recalculated status) so
+    callers can refresh their display without a follow-up SELECT. When a
+    cursor from transaction() is passed, the statement joins that
+    transaction instead of committing on its own.
+    """
+
     if not student_id or not student_id.strip():
         raise ValueError("❌ Student ID is Empty: You must provide a Student ID. Student ID cannot be blank.")
     if not name or not name.strip():
         raise ValueError("❌ Name is Empty: You must provide a Student Name. Name field cannot be blank.")
-    
-    status = calculate_status(gpa)
-    
+
+    params = (student_id, name, age, email, department, gpa, graduation_year, record_id)
+
     try:
+        if cursor is not None:
+            if department:
+                cursor.execute(_SQL_INSERT_DEPT, (department,))
+            result = cursor.execute(_SQL_UPDATE, params).fetchone()
+            if result is None:
+                raise ValueError(f"❌ Record Not Found: No student record found with ID {record_id}. The record may have been deleted.")
+            return result
+
         with get_db_connection(db_path) as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                UPDATE student 
-                SET student_id=?, name=?, age=?, email=?, department=?, 
-                    gpa=?, graduation_year=?, status=?
-                WHERE id=?
-            """, (student_id, name, age, email, department, gpa, graduation_year, status, record_id))
-            
-            if cursor.rowcount == 0:
+            own_cursor = conn.cursor()
+
+            if department:
+                own_cursor.execute(_SQL_INSERT_DEPT, (department,))
+            result = own_cursor.execute(_SQL_UPDATE, params).fetchone()
+
+            if result is None:
                 raise ValueError(f"❌ Record Not Found: No student record found with ID {record_id}. The record may have been deleted.")
-            
+
             conn.commit()
-            return True
+            return result
     except sqlite3.Error as e:
         raise RuntimeError(f"❌ Database Update Error: Failed to update student record. Details: {str(e)}")
 
 
-def delete_record(record_id: int, db_path: str = DEFAULT_DB_PATH) -> bool:
-    """Delete a student record by ID."""
+def delete_record(record_id: int, db_path: str = DEFAULT_DB_PATH, cursor: Optional[sqlite3.Cursor] = None) -> bool:
+    """Delete a student record by ID.
+
+    When a cursor from transaction() is passed, the statement joins that
+    transaction instead of committing on its own.
+    """
     if not isinstance(record_id, int) or record_id <= 0:
         raise ValueError("❌ Invalid Record ID: Record ID must be a positive number. The ID you provided is invalid.")
-    
+
     try:
+        if cursor is not None:
+            result = cursor.execute(_SQL_DELETE, (record_id,)).fetchone()
+            if result is None:
+                raise ValueError(f"❌ Record Not Found: No student record found with ID {record_id}. Cannot delete a non-existent record.")
+            return True
+
         with get_db_connection(db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM student WHERE id = ?", (record_id,))
-            
-            if cursor.rowcount == 0:
+            own_cursor = conn.cursor()
+            result = own_cursor.execute(_SQL_DELETE, (record_id,)).fetchone()
+
+            if result is None:
                 raise ValueError(f"❌ Record Not Found: No student record found with ID {record_id}. Cannot delete a non-existent record.")
-            
+
             conn.commit()
             return True
     except sqlite3.Error as e:
@@ -199,26 +786,23 @@ def delete_record(record_id: int, db_path: str = DEFAULT_DB_PATH) -> bool:
 def get_statistics(db_path: str = DEFAULT_DB_PATH) -> dict:
     """Get database statistics (Pass/Fail counts, etc)."""
     try:
-        with get_db_connection(db_path) as conn:
+        with get_ro_connection(db_path) as conn:
             cursor = conn.cursor()
-            
-            cursor.execute("SELECT COUNT(*) FROM student")
-            total = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM student WHERE status='PASS'")
-            pass_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM student WHERE status='FAIL'")
-            fail_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT AVG(gpa) FROM student")
-            avg_gpa = cursor.fetchone()[0] or 0.0
-            
+
+            # One scan computes all four aggregates instead of four
+            # separate statements re-reading the table.
+            cursor.execute(_SQL_STATS)
+            total, pass_count, fail_count, avg_gpa, gpa_sum = cursor.fetchone()
+
             return {
                 'total': total,
                 'pass': pass_count,
                 'fail': fail_count,
-                'avg_gpa': round(avg_gpa, 2)
+                'avg_gpa': round(avg_gpa, 2),
+                # Unrounded, for callers that maintain incremental
+                # counters; seeding from the rounded average would bake
+                # in up to 0.005 * total of error.
+                'gpa_sum': gpa_sum
             }
     except sqlite3.Error as e:
         raise RuntimeError(f"❌ Statistics Error: Failed to calculate statistics. Details: {str(e)}")
@@ -0,0 +1,44 @@
+"""
+Student Database Management System - Migration
+Rewrites a pre-normalization students.db (TEXT department/status columns)
+into the current schema (departments lookup table, generated INTEGER status)
+Usage: python migrate_db.py [db_path]
+"""
+
+import os
+import sqlite3
+import sys
+
+import config
+import database
+
+
+def migrate(db_path: str = config.DEFAULT_DB_PATH) -> None:
+    """Migrate an old-schema database file in place (old file kept as .bak)."""
+    if not os.path.exists(db_path):
+        print(f"[INFO] No database at '{db_path}', nothing to migrate")
+        return
+
+    conn = sqlite3.connect(db_path)
+    try:
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(student)")]
+        if 'department_id' in columns:
+            print("[INFO] Database already uses the current schema")
+            return
+        rows = conn.execute("""
+            SELECT student_id, name, age, email, department, gpa, graduation_year
+            FROM student
+        """).fetchall()
+    finally:
+        conn.close()
+
+    backup_path = db_path + ".bak"
+    os.replace(db_path, backup_path)
+    database.init_database(db_path)
+    report = database.add_student_records_bulk(rows, db_path)
+    print(f"[INFO] Migrated {report['inserted']} records "
+          f"({report['skipped']} skipped), old database kept at '{backup_path}'")
+
+
+if __name__ == "__main__":
+    migrate(sys.argv[1] if len(sys.argv) > 1 else config.DEFAULT_DB_PATH)
@@ -11,12 +11,39 @@ Features:
 
 from tkinter import *
 from tkinter import messagebox, filedialog, ttk
-from datetime import datetime
+from datetime import datetime, timedelta
 import database
 import config
 import csv
 import re
 
+# polars is optional: its native CSV reader/writer parses and types whole
+# columns at once, well ahead of the csv module plus per-row coercion.
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Compiled once: every save/update validates the graduation year, and
+# going through re.match would redo the pattern-cache lookup each time.
+_YEAR_RE = re.compile(r'^\d{4}\Z')
+
+
+def _to_int(s, default=None):
+    """Parse an int without raising; returns default on malformed input"""
+    s = (s or '').strip()
+    # At most one leading '-', and isdecimal() rather than isdigit():
+    # the latter admits superscripts and the like that int() rejects.
+    body = s[1:] if s.startswith('-') else s
+    return int(s) if body.isdecimal() else default
+
+
+def _to_float(s, default=None):
+    """Parse a float without raising; returns default on malformed input"""
+    s = (s or '').strip()
+    body = s[1:] if s.startswith('-') else s
+    return float(s) if body.replace('.', '', 1).isdecimal() else default
+
 
 class StudentApp:
     """Student Database Management System GUI Application."""
@@ -36,6 +63,28 @@ class StudentApp:
         
         self.selected_record = None
         self.db_id = None
+        # student_id -> full record, rebuilt by display_all_records, so
+        # selection handling never re-queries the database.
+        self._id_index = {}
+        # Virtualized view state: all records stay in this list; only the
+        # window around the scroll position is ever inserted into the tree.
+        self._all_records = []
+        self._win_start = 0
+        # Starting guess; _on_table_configure resizes the window to the
+        # actual viewport once the table is laid out.
+        self._window_rows = 20
+        # student_id -> position in _all_records, so highlighting can
+        # jump the virtual window straight to a record.
+        self._pos_by_sid = {}
+        # Cached statistics counters (total/pass/fail/gpa_sum); None
+        # means the next update_statistics reloads them from the DB.
+        self._stats = None
+        # Add/Update dialogs are built once and hidden with withdraw()
+        # instead of destroyed: Tk widget creation is the expensive part.
+        self._add_dialog = None
+        self._add_fields = None
+        self._update_dialog = None
+        self._update_fields = None
         
         self._create_widgets()
         self._setup_layout()
@@ -150,16 +199,22 @@ class StudentApp:
         style.configure("Treeview", background=config.LIST_BG, fieldbackground=config.LIST_BG)
         style.configure("Treeview.Heading", background=config.ACCENT_COLOR, foreground="white")
         
-        vsb = ttk.Scrollbar(table_frame, orient=VERTICAL, command=self.table.yview)
+        # The vertical scrollbar drives the virtual window rather than the
+        # widget's own view: the tree only ever holds the rendered slice.
+        self.vsb = ttk.Scrollbar(table_frame, orient=VERTICAL, command=self._on_vscroll)
         hsb = ttk.Scrollbar(table_frame, orient=HORIZONTAL, command=self.table.xview)
-        
-        self.table.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-        
+
+        self.table.configure(xscrollcommand=hsb.set)
+
         self.table.grid(row=0, column=0, sticky='nsew')
-        vsb.grid(row=0, column=1, sticky='ns')
+        self.vsb.grid(row=0, column=1, sticky='ns')
         hsb.grid(row=1, column=0, sticky='ew')
-        
+
         self.table.bind('<ButtonRelease-1>', self.on_table_click)
+        self.table.bind('<Configure>', self._on_table_configure)
+        self.table.bind('<MouseWheel>', self._on_mousewheel)
+        self.table.bind('<Button-4>', self._on_mousewheel)
+        self.table.bind('<Button-5>', self._on_mousewheel)
         
         table_frame.grid_rowconfigure(0, weight=1)
         table_frame.grid_columnconfigure(0, weight=1)
@@ -240,26 +295,47 @@ class StudentApp:
     
     def _start_clock(self):
         """Start updating clock and date"""
+        self._last_clock_text = None
         self._update_clock()
-    
+        self._update_date()
+
     def _update_clock(self):
-        """Update clock display"""
+        """Update clock display (reconfigures the label only on change)"""
+        text = datetime.now().strftime("%H:%M:%S")
+        if text != self._last_clock_text:
+            self._last_clock_text = text
+            self.clock_label.config(text=text)
+        self.root.after(1000, self._update_clock)
+
+    def _update_date(self):
+        """Update date display and reschedule at the next midnight
+
+        The date changes once a day, so it gets its own timer instead of
+        being reformatted and reconfigured on every clock tick.
+        """
         now = datetime.now()
-        self.clock_label.config(text=now.strftime("%H:%M:%S"))
         self.date_label.config(text=now.strftime("%a %d/%m/%Y"))
-        self.root.after(1000, self._update_clock)
+        midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        ms_to_midnight = int((midnight - now).total_seconds() * 1000) + 1000
+        self.root.after(ms_to_midnight, self._update_date)
     
     def on_table_click(self, event):
         """Store selected record info"""
-        item = self.table.selection()
-        if item:
-            values = self.table.item(item, 'values')
-            records = database.view_all_records()
-            for record in records:
-                if record[1] == values[0]:
-                    self.db_id = record[0]
-                    self.selected_record = record
-                    break
+        sid = self.table.focus()
+        if sid:
+            record = self._id_index.get(sid)
+            if record:
+                self.db_id = record[0]
+                self.selected_record = record
+            else:
+                # Cache went stale (e.g. the row changed under us); resolve
+                # the database id from the narrow id/student_id projection
+                # rather than re-fetching every full record.
+                for db_id, student_id in database.list_id_pairs():
+                    if student_id == sid:
+                        self.db_id = db_id
+                        self.selected_record = database.search_by_student_id(sid)
+                        break
     
     def search_student(self):
         """Search for student by Student ID"""
@@ -270,7 +346,7 @@ class StudentApp:
             return
         
         try:
-            record = database.search_by_student_id(search_term)
+            record = database.search_by_student_id_or_raise(search_term)
             self._highlight_record(record)
             messagebox.showinfo("✅ Found", f"Student found: {record[2]}")
         except ValueError as e:
@@ -280,234 +356,318 @@ class StudentApp:
     
     def _highlight_record(self, record):
         """Highlight matching record in table"""
-        for item in self.table.get_children():
-            values = self.table.item(item, 'values')
-            if values[0] == record[1]:
-                self.table.selection_set(item)
-                self.table.see(item)
-                self.db_id = record[0]
-                self.selected_record = record
-                break
+        pos = self._pos_by_sid.get(record[1])
+        if pos is None:
+            return
+        self._render_window(pos)
+        sid = str(record[1])
+        if self.table.exists(sid):
+            self.table.selection_set(sid)
+            self.table.see(sid)
+        self.db_id = record[0]
+        self.selected_record = record
     
     def clear_search(self):
         """Clear search and reload all records"""
         self.search_term.set("")
         self.display_all_records()
     
+    def _on_table_configure(self, event):
+        """Match the virtual window size to the visible viewport
+
+        The table stretches with the main window, so the number of rows
+        it can show is only known at layout time; render cost and tree
+        memory still stay constant no matter how large the student table
+        grows, because only the visible slice is ever inserted.
+        """
+        rowheight = ttk.Style().lookup("Treeview", "rowheight") or 20
+        # One rowheight off the top approximates the heading band.
+        rows = max(1, event.height // int(rowheight) - 1)
+        if rows != self._window_rows:
+            self._window_rows = rows
+            self._render_window(self._win_start)
+
     def display_all_records(self):
-        """Display all records in table"""
-        for item in self.table.get_children():
-            self.table.delete(item)
-        
+        """Load all records and render the visible window of the table"""
+        self._id_index.clear()
         try:
             records = database.view_all_records()
-            for row in records:
-                self.table.insert("", END, values=(
-                    row[1], row[2], row[3], row[4], row[5], 
-                    f"{row[6]:.2f}", row[7], row[8]
-                ))
         except RuntimeError as e:
             messagebox.showerror("Database Error", str(e))
+            return
+
+        self._all_records = records
+        self._pos_by_sid.clear()
+        for pos, r in enumerate(records):
+            self._id_index[r[1]] = r
+            self._pos_by_sid[r[1]] = pos
+        self._render_window(0)
+
+    def _render_window(self, first):
+        """Render the window of records starting at index first"""
+        total = len(self._all_records)
+        first = max(0, min(first, total - self._window_rows))
+        self._win_start = first
+
+        children = self.table.get_children()
+        if children:
+            self.table.delete(*children)
+        # student_id doubles as the tree iid (it is UNIQUE in the
+        # database), so selection and highlight address rows directly.
+        for row in self._all_records[first:first + self._window_rows]:
+            values = (row[1], row[2], row[3], row[4], row[5],
+                      format(row[6], '.2f'), row[7], row[8])
+            try:
+                self.table.insert("", END, iid=str(row[1]), values=values)
+            except TclError:
+                self.table.insert("", END, values=values)
+
+        if total > 0:
+            self.vsb.set(first / total, min(1.0, (first + self._window_rows) / total))
+        else:
+            self.vsb.set(0.0, 1.0)
+
+    def _on_vscroll(self, action, amount, units=None):
+        """Translate scrollbar commands into virtual window moves"""
+        if action == 'moveto':
+            self._render_window(int(float(amount) * len(self._all_records)))
+        elif action == 'scroll':
+            step = self._window_rows if units == 'pages' else 3
+            self._render_window(self._win_start + int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        """Scroll the virtual window with the mouse wheel"""
+        if event.num == 4 or event.delta > 0:
+            self._render_window(self._win_start - 3)
+        else:
+            self._render_window(self._win_start + 3)
+        return "break"
     
-    def update_statistics(self):
-        """Update statistics display"""
+    def _load_stats(self):
+        """Initialize the cached counters from one aggregation query"""
         try:
             stats = database.get_statistics()
-            self.total_label.config(text=f"Total: {stats['total']}")
-            self.pass_label.config(text=f"PASS: {stats['pass']}")
-            self.fail_label.config(text=f"FAIL: {stats['fail']}")
-            self.gpa_label.config(text=f"Avg GPA: {stats['avg_gpa']}")
         except RuntimeError:
-            pass
+            return
+        self._stats = {
+            'total': stats['total'],
+            'pass': stats['pass'],
+            'fail': stats['fail'],
+            'gpa_sum': stats['gpa_sum'],
+        }
+
+    def _apply_stats_delta(self, added_gpa=None, removed_gpa=None):
+        """Adjust the cached counters for a single-record change
+
+        Pass added_gpa for an insert, removed_gpa for a delete, and both
+        for an update, so the stats panel refresh costs O(1) instead of
+        re-aggregating the table.
+        """
+        if self._stats is None:
+            return
+        s = self._stats
+        if removed_gpa is not None:
+            s['total'] -= 1
+            s['gpa_sum'] -= float(removed_gpa)
+            s['pass' if database.calculate_status(removed_gpa) == 'PASS' else 'fail'] -= 1
+        if added_gpa is not None:
+            s['total'] += 1
+            s['gpa_sum'] += float(added_gpa)
+            s['pass' if database.calculate_status(added_gpa) == 'PASS' else 'fail'] += 1
+
+    def _invalidate_stats(self):
+        """Force the next update_statistics to reload from the database"""
+        self._stats = None
+
+    def update_statistics(self):
+        """Update statistics display from the cached counters"""
+        if self._stats is None:
+            self._load_stats()
+            if self._stats is None:
+                return
+        s = self._stats
+        avg_gpa = round(s['gpa_sum'] / s['total'], 2) if s['total'] else 0.0
+        self.total_label.config(text=f"Total: {s['total']}")
+        self.pass_label.config(text=f"PASS: {s['pass']}")
+        self.fail_label.config(text=f"FAIL: {s['fail']}")
+        self.gpa_label.config(text=f"Avg GPA: {avg_gpa}")
     
-    def show_add_dialog(self):
-        """Show Add Student dialog"""
-        dialog = Toplevel(self.root)
-        dialog.title("Add New Student")
+    _FIELD_LIST = ("Student ID", "Name", "Age", "Email", "Department", "GPA", "Graduation Year")
+
+    def _build_student_form(self, dialog, title, initial=None):
+        """Build the shared Add/Update form; returns {field: widget_or_var}"""
         dialog.geometry("400x400")
         dialog.config(bg=config.SECONDARY_COLOR)
-        
-        title_label = Label(dialog, text="Add New Student", font=config.HEADER_FONT,
+
+        title_label = Label(dialog, text=title, font=config.HEADER_FONT,
                            bg=config.SECONDARY_COLOR, fg=config.HEADER_COLOR)
         title_label.pack(pady=10)
-        
+
         fields = {}
-        field_list = ["Student ID", "Name", "Age", "Email", "Department", "GPA", "Graduation Year"]
-        
-        for field in field_list:
+        for i, field in enumerate(self._FIELD_LIST):
             frame = Frame(dialog, bg=config.SECONDARY_COLOR)
             frame.pack(fill=X, padx=10, pady=5)
-            
+
             label = Label(frame, text=field, font=config.LABEL_FONT,
                          bg=config.SECONDARY_COLOR, fg=config.TEXT_COLOR, width=15)
             label.pack(side=LEFT)
-            
+
             if field == "Department":
-                var = StringVar(value="Select Department")
+                var = StringVar(value=initial[i] if initial else "Select Department")
                 combo = ttk.Combobox(frame, textvariable=var, values=config.DEPARTMENTS,
                                     state="readonly", width=20)
                 combo.pack(side=LEFT, padx=5)
                 fields[field] = var
             else:
                 entry = Entry(frame, font=config.ENTRY_FONT, width=25, bg=config.LIST_BG)
+                if initial is not None:
+                    entry.insert(0, str(initial[i]))
                 entry.pack(side=LEFT, padx=5)
                 fields[field] = entry
-        
-        btn_frame = Frame(dialog, bg=config.SECONDARY_COLOR)
-        btn_frame.pack(pady=10)
-        
-        def save():
-            try:
-                if not fields["Student ID"].get().strip():
-                    raise ValueError("❌ Student ID Required: Student ID field is empty. Please enter a unique Student ID.")
-                if not fields["Name"].get().strip():
-                    raise ValueError("❌ Name Required: Name field is empty. Please enter the student's full name.")
-                if fields["Department"].get() == "Select Department":
-                    raise ValueError("❌ Department Required: Please select a department from the dropdown menu.")
-                
-                try:
-                    age = int(fields["Age"].get())
-                except ValueError:
-                    raise ValueError(f"❌ Age Invalid Format: Age must be a whole number. You entered '{fields['Age'].get()}'.")
-                
+        return fields
+
+    def _read_and_validate_form(self, fields):
+        """Validate the form and return the parsed record values.
+
+        Returns (student_id, name, age, email, department, gpa, year);
+        raises ValueError with a user-facing message on invalid input.
+        """
+        if not fields["Student ID"].get().strip():
+            raise ValueError("❌ Student ID Required: Student ID field is empty. Please enter a unique Student ID.")
+        if not fields["Name"].get().strip():
+            raise ValueError("❌ Name Required: Name field is empty. Please enter the student's full name.")
+        if fields["Department"].get() == "Select Department":
+            raise ValueError("❌ Department Required: Please select a department from the dropdown menu.")
+
+        try:
+            age = int(fields["Age"].get())
+        except ValueError:
+            raise ValueError(f"❌ Age Invalid Format: Age must be a whole number. You entered '{fields['Age'].get()}'.")
+
+        gpa_str = fields["GPA"].get()
+        try:
+            gpa = float(gpa_str)
+        except ValueError:
+            raise ValueError(f"❌ GPA Invalid Format: GPA must be a decimal number. You entered '{gpa_str}'.")
+        if gpa < config.MIN_GPA or gpa > config.MAX_GPA:
+            raise ValueError(f"❌ Invalid GPA: GPA must be between {config.MIN_GPA} and {config.MAX_GPA}. You entered {gpa}.")
+
+        year_str = fields["Graduation Year"].get().strip()
+        if not _YEAR_RE.match(year_str):
+            raise ValueError(f"❌ Year Invalid Format: Graduation year must be in YYYY format (4 digits). You entered '{year_str}'.")
+        year = int(year_str)
+
+        return (
+            fields["Student ID"].get().strip(),
+            fields["Name"].get().strip(),
+            age,
+            fields["Email"].get().strip(),
+            fields["Department"].get(),
+            gpa,
+            year
+        )
+
+    def _set_form_values(self, fields, values):
+        """Fill the shared form widgets with the given values"""
+        for field, value in zip(self._FIELD_LIST, values):
+            widget = fields[field]
+            if field == "Department":
+                widget.set(value)
+            else:
+                widget.delete(0, END)
+                widget.insert(0, str(value))
+
+    def show_add_dialog(self):
+        """Show Add Student dialog (built once, reused thereafter)"""
+        if self._add_dialog is None:
+            dialog = Toplevel(self.root)
+            dialog.title("Add New Student")
+            fields = self._build_student_form(dialog, "Add New Student")
+
+            btn_frame = Frame(dialog, bg=config.SECONDARY_COLOR)
+            btn_frame.pack(pady=10)
+
+            def save():
                 try:
-                    gpa = float(fields["GPA"].get())
-                    if gpa < config.MIN_GPA or gpa > config.MAX_GPA:
-                        raise ValueError(f"❌ Invalid GPA: GPA must be between {config.MIN_GPA} and {config.MAX_GPA}. You entered {gpa}.")
+                    values = self._read_and_validate_form(fields)
+                    database.add_student_record(*values)
+                    self._apply_stats_delta(added_gpa=values[5])
+                    messagebox.showinfo("✅ Success", "Student added successfully!")
+                    dialog.withdraw()
+                    self.display_all_records()
+                    self.update_statistics()
                 except ValueError as e:
-                    if "Invalid GPA" in str(e):
-                        raise
-                    raise ValueError(f"❌ GPA Invalid Format: GPA must be a decimal number. You entered '{fields['GPA'].get()}'.")
-                
-                year_str = fields["Graduation Year"].get().strip()
-                if not re.match(r'^\d{4}$', year_str):
-                    raise ValueError(f"❌ Year Invalid Format: Graduation year must be in YYYY format (4 digits). You entered '{year_str}'.")
-                year = int(year_str)
-                
-                database.add_student_record(
-                    fields["Student ID"].get().strip(),
-                    fields["Name"].get().strip(),
-                    age,
-                    fields["Email"].get().strip(),
-                    fields["Department"].get(),
-                    gpa,
-                    year
-                )
-                messagebox.showinfo("✅ Success", "Student added successfully!")
-                dialog.destroy()
-                self.display_all_records()
-                self.update_statistics()
-            except ValueError as e:
-                messagebox.showerror("Input Error", str(e))
-            except RuntimeError as e:
-                messagebox.showerror("Database Error", str(e))
-        
-        save_btn = Button(btn_frame, text="Save", font=config.BUTTON_FONT,
-                         bg=config.ACCENT_COLOR, fg="white", width=15, command=save)
-        save_btn.pack(side=LEFT, padx=5)
-        
-        cancel_btn = Button(btn_frame, text="Cancel", font=config.BUTTON_FONT,
-                           bg="#FFD700", fg="white", width=15, command=dialog.destroy)
-        cancel_btn.pack(side=LEFT, padx=5)
-    
+                    messagebox.showerror("Input Error", str(e))
+                except RuntimeError as e:
+                    messagebox.showerror("Database Error", str(e))
+
+            save_btn = Button(btn_frame, text="Save", font=config.BUTTON_FONT,
+                             bg=config.ACCENT_COLOR, fg="white", width=15, command=save)
+            save_btn.pack(side=LEFT, padx=5)
+
+            cancel_btn = Button(btn_frame, text="Cancel", font=config.BUTTON_FONT,
+                               bg="#FFD700", fg="white", width=15, command=dialog.withdraw)
+            cancel_btn.pack(side=LEFT, padx=5)
+
+            dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+            self._add_dialog = dialog
+            self._add_fields = fields
+        else:
+            self._set_form_values(self._add_fields,
+                                  ("", "", "", "", "Select Department", "", ""))
+            self._add_dialog.deiconify()
+            self._add_dialog.lift()
+
     def show_update_dialog(self):
-        """Show Update Student dialog"""
+        """Show Update Student dialog (built once, refilled per selection)"""
         if not self.selected_record:
             messagebox.showwarning("Selection Error", "❌ No Student Selected: Please click on a student row in the table to select them before updating.")
             return
-        
-        dialog = Toplevel(self.root)
-        dialog.title("Update Student")
-        dialog.geometry("400x400")
-        dialog.config(bg=config.SECONDARY_COLOR)
-        
-        title_label = Label(dialog, text="Update Student", font=config.HEADER_FONT,
-                           bg=config.SECONDARY_COLOR, fg=config.HEADER_COLOR)
-        title_label.pack(pady=10)
-        
-        fields = {}
-        field_list = ["Student ID", "Name", "Age", "Email", "Department", "GPA", "Graduation Year"]
-        values = [self.selected_record[1], self.selected_record[2], self.selected_record[3],
-                 self.selected_record[4], self.selected_record[5], self.selected_record[6],
-                 self.selected_record[7]]
-        
-        for i, field in enumerate(field_list):
-            frame = Frame(dialog, bg=config.SECONDARY_COLOR)
-            frame.pack(fill=X, padx=10, pady=5)
-            
-            label = Label(frame, text=field, font=config.LABEL_FONT,
-                         bg=config.SECONDARY_COLOR, fg=config.TEXT_COLOR, width=15)
-            label.pack(side=LEFT)
-            
-            if field == "Department":
-                var = StringVar(value=values[i])
-                combo = ttk.Combobox(frame, textvariable=var, values=config.DEPARTMENTS,
-                                    state="readonly", width=20)
-                combo.pack(side=LEFT, padx=5)
-                fields[field] = var
-            else:
-                entry = Entry(frame, font=config.ENTRY_FONT, width=25, bg=config.LIST_BG)
-                entry.insert(0, str(values[i]))
-                entry.pack(side=LEFT, padx=5)
-                fields[field] = entry
-        
-        btn_frame = Frame(dialog, bg=config.SECONDARY_COLOR)
-        btn_frame.pack(pady=10)
-        
-        def update():
-            try:
-                if not fields["Student ID"].get().strip():
-                    raise ValueError("❌ Student ID Required: Student ID field is empty. Please enter a Student ID.")
-                if not fields["Name"].get().strip():
-                    raise ValueError("❌ Name Required: Name field is empty. Please enter the student's name.")
-                if fields["Department"].get() == "Select Department":
-                    raise ValueError("❌ Department Required: Please select a department from the dropdown menu.")
-                
-                try:
-                    age = int(fields["Age"].get())
-                except ValueError:
-                    raise ValueError(f"❌ Age Invalid Format: Age must be a whole number. You entered '{fields['Age'].get()}'.")
-                
+
+        if self._update_dialog is None:
+            dialog = Toplevel(self.root)
+            dialog.title("Update Student")
+            fields = self._build_student_form(dialog, "Update Student")
+
+            btn_frame = Frame(dialog, bg=config.SECONDARY_COLOR)
+            btn_frame.pack(pady=10)
+
+            def update():
                 try:
-                    gpa = float(fields["GPA"].get())
-                    if gpa < config.MIN_GPA or gpa > config.MAX_GPA:
-                        raise ValueError(f"❌ Invalid GPA: GPA must be between {config.MIN_GPA} and {config.MAX_GPA}. You entered {gpa}.")
+                    old_gpa = self.selected_record[6]
+                    values = self._read_and_validate_form(fields)
+                    updated = database.update_record(self.db_id, *values)
+                    self._apply_stats_delta(added_gpa=values[5], removed_gpa=old_gpa)
+                    # Keep the selection current: a second update (or a
+                    # delete) without re-clicking the row must compute
+                    # its delta from the fresh values, not the old ones.
+                    self.selected_record = updated
+                    self._id_index[updated[1]] = updated
+                    messagebox.showinfo("✅ Success", "Student updated successfully!")
+                    dialog.withdraw()
+                    self.display_all_records()
+                    self.update_statistics()
                 except ValueError as e:
-                    if "Invalid GPA" in str(e):
-                        raise
-                    raise ValueError(f"❌ GPA Invalid Format: GPA must be a decimal number. You entered '{fields['GPA'].get()}'.")
-                
-                year_str = fields["Graduation Year"].get().strip()
-                if not re.match(r'^\d{4}$', year_str):
-                    raise ValueError(f"❌ Year Invalid Format: Graduation year must be in YYYY format (4 digits). You entered '{year_str}'.")
-                year = int(year_str)
-                
-                database.update_record(
-                    self.db_id,
-                    fields["Student ID"].get().strip(),
-                    fields["Name"].get().strip(),
-                    age,
-                    fields["Email"].get().strip(),
-                    fields["Department"].get(),
-                    gpa,
-                    year
-                )
-                messagebox.showinfo("✅ Success", "Student updated successfully!")
-                dialog.destroy()
-                self.display_all_records()
-                self.update_statistics()
-            except ValueError as e:
-                messagebox.showerror("Input Error", str(e))
-            except RuntimeError as e:
-                messagebox.showerror("Database Error", str(e))
-        
-        save_btn = Button(btn_frame, text="Update", font=config.BUTTON_FONT,
-                         bg=config.SUCCESS_COLOR, fg="white", width=15, command=update)
-        save_btn.pack(side=LEFT, padx=5)
-        
-        cancel_btn = Button(btn_frame, text="Cancel", font=config.BUTTON_FONT,
-                           bg="#FFD700", fg="white", width=15, command=dialog.destroy)
-        cancel_btn.pack(side=LEFT, padx=5)
+                    messagebox.showerror("Input Error", str(e))
+                except RuntimeError as e:
+                    messagebox.showerror("Database Error", str(e))
+
+            save_btn = Button(btn_frame, text="Update", font=config.BUTTON_FONT,
+                             bg=config.SUCCESS_COLOR, fg="white", width=15, command=update)
+            save_btn.pack(side=LEFT, padx=5)
+
+            cancel_btn = Button(btn_frame, text="Cancel", font=config.BUTTON_FONT,
+                               bg="#FFD700", fg="white", width=15, command=dialog.withdraw)
+            cancel_btn.pack(side=LEFT, padx=5)
+
+            dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+            self._update_dialog = dialog
+            self._update_fields = fields
+        else:
+            self._update_dialog.deiconify()
+            self._update_dialog.lift()
+
+        self._set_form_values(self._update_fields, self.selected_record[1:8])
     
     def show_delete_dialog(self):
         """Show Delete Student dialog"""
@@ -521,11 +681,29 @@ class StudentApp:
         if confirm:
             try:
                 database.delete_record(self.db_id)
+                self._apply_stats_delta(removed_gpa=self.selected_record[6])
+                self._remove_cached_record(self.selected_record[1])
                 messagebox.showinfo("✅ Success", "Student deleted successfully!")
-                self.display_all_records()
                 self.update_statistics()
             except Exception as e:
                 messagebox.showerror("Delete Error", str(e))
+
+    def _remove_cached_record(self, sid):
+        """Drop one record from the caches and re-render the window
+
+        A delete only removes one known row, so the caches are adjusted
+        in place instead of reloading the whole table from the database.
+        """
+        pos = self._pos_by_sid.pop(sid, None)
+        self._id_index.pop(sid, None)
+        if pos is not None:
+            del self._all_records[pos]
+            # Every record after the removed one shifts down a slot.
+            for r in self._all_records[pos:]:
+                self._pos_by_sid[r[1]] = self._pos_by_sid[r[1]] - 1
+        self._render_window(self._win_start)
+        self.selected_record = None
+        self.db_id = None
     
     def import_csv(self):
         """Import CSV file"""
@@ -536,39 +714,80 @@ class StudentApp:
         
         if not file_path:
             return
-        
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                csv_reader = csv.DictReader(file)
-                
-                if not csv_reader.fieldnames:
-                    messagebox.showerror("CSV Error", "❌ Empty CSV File: The selected CSV file is empty or has no header row. Please select a valid CSV file with data.")
+            if pl is not None:
+                batch, skipped = self._read_csv_polars(file_path)
+            else:
+                result = self._read_csv_stdlib(file_path)
+                if result is None:
                     return
-                
-                imported = 0
-                skipped = 0
-                
-                for row in csv_reader:
-                    try:
-                        database.add_student_record(
-                            row.get('StudentID', '').strip(),
-                            row.get('Name', '').strip(),
-                            int(row.get('Age', 0)),
-                            row.get('Email', '').strip(),
-                            row.get('Department', '').strip(),
-                            float(row.get('GPA', 0)),
-                            int(row.get('GraduationYear', 0))
-                        )
-                        imported += 1
-                    except (ValueError, KeyError):
-                        skipped += 1
-                        continue
-                
-                self.display_all_records()
-                self.update_statistics()
-                messagebox.showinfo("✅ Import Complete", f"Successfully imported {imported} students\nSkipped {skipped} invalid rows")
+                batch, skipped = result
+
+            report = database.add_student_records_bulk(batch)
+
+            self.display_all_records()
+            # One full recompute for the whole batch, not one per row.
+            self._invalidate_stats()
+            self.update_statistics()
+            messagebox.showinfo("✅ Import Complete", f"Successfully imported {report['inserted']} students\nSkipped {skipped + report['skipped']} invalid rows")
         except Exception as e:
             messagebox.showerror("Import Error", f"❌ Failed to import CSV: {str(e)}")
+
+    def _read_csv_polars(self, file_path):
+        """Parse a CSV with polars' native reader (fast path)"""
+        df = pl.read_csv(file_path)
+        total = df.height
+        df = df.with_columns(
+            pl.col('Age').cast(pl.Int64, strict=False),
+            pl.col('GPA').cast(pl.Float64, strict=False),
+            pl.col('GraduationYear').cast(pl.Int64, strict=False),
+        ).drop_nulls(['StudentID', 'Name', 'Age', 'GPA', 'GraduationYear'])
+        batch = list(df.select(config.CSV_COLUMNS).iter_rows())
+        return batch, total - len(batch)
+
+    def _read_csv_stdlib(self, file_path):
+        """Parse a CSV with the csv module (fallback when polars is absent)"""
+        # 1 MiB read buffer; csv.reader with positional access avoids
+        # the per-row dict that DictReader builds.
+        with open(file_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as file:
+            csv_reader = csv.reader(file)
+
+            header = next(csv_reader, None)
+            if not header:
+                messagebox.showerror("CSV Error", "❌ Empty CSV File: The selected CSV file is empty or has no header row. Please select a valid CSV file with data.")
+                return None
+            idx = {name: i for i, name in enumerate(header)}
+
+            def col(row, name):
+                i = idx.get(name)
+                return row[i] if i is not None and i < len(row) else ''
+
+            # Collect the whole file into one batch: a single
+            # transaction commits once instead of once per row.
+            batch = []
+            skipped = 0
+
+            # Cheap predicate checks: a malformed cell costs an is-None
+            # branch, not an exception raise and catch per bad row.
+            for row in csv_reader:
+                age = _to_int(col(row, 'Age'))
+                gpa = _to_float(col(row, 'GPA'))
+                year = _to_int(col(row, 'GraduationYear'))
+                if age is None or gpa is None or year is None:
+                    skipped += 1
+                    continue
+                batch.append((
+                    col(row, 'StudentID').strip(),
+                    col(row, 'Name').strip(),
+                    age,
+                    col(row, 'Email').strip(),
+                    col(row, 'Department').strip(),
+                    gpa,
+                    year
+                ))
+
+            return batch, skipped
     
     def export_csv(self):
         """Export to CSV file"""
@@ -588,27 +807,55 @@ class StudentApp:
                 messagebox.showwarning("No Data", "❌ No Records to Export: The database is empty. Please add some student records before exporting.")
                 return
             
-            with open(file_path, 'w', newline='', encoding='utf-8') as file:
-                fieldnames = ['StudentID', 'Name', 'Age', 'Email', 'Department', 'GPA', 'GraduationYear', 'Status']
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for record in records:
-                    writer.writerow({
-                        'StudentID': record[1],
-                        'Name': record[2],
-                        'Age': record[3],
-                        'Email': record[4],
-                        'Department': record[5],
-                        'GPA': record[6],
-                        'GraduationYear': record[7],
-                        'Status': record[8]
-                    })
-            
+            fieldnames = ['StudentID', 'Name', 'Age', 'Email', 'Department', 'GPA', 'GraduationYear', 'Status']
+
+            if pl is not None:
+                pl.DataFrame({
+                    name: [record[i + 1] for record in records]
+                    for i, name in enumerate(fieldnames)
+                }).write_csv(file_path)
+            else:
+                with open(file_path, 'w', newline='', encoding='utf-8') as file:
+                    # Plain csv.writer with a generator: rows stream out
+                    # in field order with no per-row dict construction.
+                    writer = csv.writer(file)
+                    writer.writerow(fieldnames)
+                    writer.writerows(
+                        (r[1], r[2], r[3], r[4], r[5], r[6], r[7], r[8])
+                        for r in records
+                    )
+
             messagebox.showinfo("✅ Export Success", f"Data exported successfully to:\n{file_path}")
         except Exception as e:
             messagebox.showerror("Export Error", f"❌ Failed to export CSV: {str(e)}")
     
+    def _show_context_menu(self, event):
+        """Show context menu on right-click"""
+        item = self.table.selection()
+        if not item:
+            messagebox.showinfo("Selection Required", "❌ No Row Selected: Right-click on a student row to open the context menu.")
+            return
+
+        # The iid is the student_id; the click handler has usually set
+        # the selection already, this just keeps it in sync.
+        record = self._id_index.get(item[0])
+        if record:
+            self.db_id = record[0]
+            self.selected_record = record
+
+        menu = Toplevel(self.root)
+        menu.wm_overrideredirect(True)
+        menu.wm_geometry(f"+{event.x_root}+{event.y_root}")
+
+        add_btn = Button(menu, text="Add New", width=20, command=self.show_add_dialog)
+        add_btn.pack()
+
+        update_btn = Button(menu, text="Update Selected", width=20, command=self.show_update_dialog)
+        update_btn.pack()
+
+        delete_btn = Button(menu, text="Delete Selected", width=20, command=self.show_delete_dialog)
+        delete_btn.pack()
+
     def exit_application(self):
         """Exit application"""
         confirm = messagebox.askyesno("Exit Application", "Are you sure you want to exit the Student Database Management System?")
@@ -616,39 +863,10 @@ class StudentApp:
             self.root.destroy()
 
 
-def show_context_menu(app, event):
-    """Show context menu on right-click"""
-    item = app.table.selection()
-    if not item:
-        messagebox.showinfo("Selection Required", "❌ No Row Selected: Right-click on a student row to open the context menu.")
-        return
-    
-    values = app.table.item(item, 'values')
-    records = database.view_all_records()
-    for record in records:
-        if record[1] == values[0]:
-            app.db_id = record[0]
-            app.selected_record = record
-            break
-    
-    menu = Toplevel(app.root)
-    menu.wm_overrideredirect(True)
-    menu.wm_geometry(f"+{event.x_root}+{event.y_root}")
-    
-    add_btn = Button(menu, text="Add New", width=20, command=app.show_add_dialog)
-    add_btn.pack()
-    
-    update_btn = Button(menu, text="Update Selected", width=20, command=app.show_update_dialog)
-    update_btn.pack()
-    
-    delete_btn = Button(menu, text="Delete Selected", width=20, command=app.show_delete_dialog)
-    delete_btn.pack()
-
-
 if __name__ == "__main__":
     root = Tk()
     app = StudentApp(root)
-    
-    app.table.bind("<Button-3>", lambda e: show_context_menu(app, e))
-    
+
+    app.table.bind("<Button-3>", app._show_context_menu)
+
     root.mainloop()
\ No newline at end of file
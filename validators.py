@@ -0,0 +1,71 @@
+"""
+Student Database Management System - Validators
+Email / Student ID pattern checks compiled once at import time
+Uses the fastest available regex engine (hyperscan > re2 > stdlib re)
+"""
+
+import config
+
+# Pick the fastest available engine. hyperscan and re2 run patterns as a
+# single DFA pass with no backtracking; the stdlib re module is the
+# always-available fallback. Validation cost shows up per row on large
+# CSV imports, so the engine is chosen and the patterns compiled exactly
+# once here.
+try:
+    import hyperscan as _hs
+except ImportError:
+    _hs = None
+
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+import re as _re
+
+_EMAIL_PATTERN = config.VALID_EMAIL_RE
+_STUDENT_ID_PATTERN = config.VALID_STUDENT_ID_RE
+
+
+if _hs is not None:
+    def _build_matcher(pattern: str):
+        db = _hs.Database()
+        db.compile(expressions=[pattern.encode()], flags=[_hs.HS_FLAG_SINGLEMATCH])
+
+        def match(value: str) -> bool:
+            hits = []
+            db.scan(value.encode(), match_event_handler=lambda *args: hits.append(1))
+            return bool(hits)
+
+        return match
+elif _re2 is not None:
+    def _build_matcher(pattern: str):
+        compiled = _re2.compile(pattern)
+        return lambda value: compiled.match(value) is not None
+else:
+    def _build_matcher(pattern: str):
+        compiled = _re.compile(pattern)
+        return lambda value: compiled.match(value) is not None
+
+
+_match_email = _build_matcher(_EMAIL_PATTERN)
+_match_student_id = _build_matcher(_STUDENT_ID_PATTERN)
+
+
+def is_valid_email(email: str) -> bool:
+    """Check email against the configured pattern. Blank emails are allowed."""
+    if not email:
+        return True
+    return _match_email(email)
+
+
+def is_valid_student_id(student_id: str) -> bool:
+    """Check Student ID against the configured pattern."""
+    if not student_id:
+        return False
+    return _match_student_id(student_id)
+
+
+def is_valid_row(student_id: str, email: str) -> bool:
+    """Validate the pattern-checked fields of one CSV row."""
+    return is_valid_student_id(student_id) and is_valid_email(email)